@@ -1,9 +1,12 @@
 import logging
-from typing import Any, Optional, Callable, cast
-from anthropic import Anthropic
-from anthropic.types import Message, MessageParam
+import threading
+from typing import TYPE_CHECKING, Any, Optional, Callable, cast
 import json
 
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+    from anthropic.types import Message, MessageParam
+
 logger = logging.getLogger(__name__)
 
 class BaseAgent:
@@ -18,7 +21,7 @@ class BaseAgent:
     """
 
     def __init__(self,
-        client: Anthropic,
+        client: "Anthropic",
         system_prompt: str,
         model: str = "claude-sonnet-4-5-20250929"
     ) -> None:
@@ -39,8 +42,9 @@ class BaseAgent:
         max_tokens: int = 4096,
         temperature: float = 1.0,
         tools: Optional[list[dict[str, Any]]] = None,
-        tool_executor: Optional[Callable[[str, dict[str, Any]], Any]] = None
-    ) -> Message:
+        tool_executor: Optional[Callable[[str, dict[str, Any]], Any]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> "Message":
         """
         Make an API call to Claude with the agent's system prompt.
         Handles tool use loop automatically if tools are provided.
@@ -51,6 +55,7 @@ class BaseAgent:
             temperature: Sampling temperature (0.0 to 1.0)
             tools: Optional list of tools the agent can use
             tool_executor: Optional function to execute tools. Takes (tool_name, tool_input) and returns results.
+            cancel_event: Optional event checked before each API call; once set, no further calls are made
 
         Returns:
             Message object from the Anthropic API (after all tool use is complete)
@@ -58,10 +63,14 @@ class BaseAgent:
         Raises:
             anthropic.APIError: If the API call fails
             ValueError: If tool use is requested but no executor provided
+            RuntimeError: If cancel_event is set before an API call
         """
-        messages: list[MessageParam] = [{"role": "user", "content": user_message}]
+        messages: list["MessageParam"] = [{"role": "user", "content": user_message}]
 
         while True:
+            if cancel_event is not None and cancel_event.is_set():
+                raise RuntimeError("Cancelled before calling Claude API")
+
             api_params: dict[str, Any] = {
                 "model": self.model,
                 "max_tokens": max_tokens,
@@ -107,12 +116,12 @@ class BaseAgent:
                                 "is_error": True
                             })
 
-                messages.append(cast(MessageParam, {"role": "user", "content": tool_results}))
+                messages.append(cast("MessageParam", {"role": "user", "content": tool_results}))
                 continue
 
-            return cast(Message, response)
+            return cast("Message", response)
 
-    def parse_response(self, message: Message) -> str:
+    def parse_response(self, message: "Message") -> str:
         """
         Extract text content from a Claude API response.
 
@@ -2,11 +2,14 @@
 
 import logging
 import json
-from anthropic import Anthropic
+from typing import TYPE_CHECKING
 
 from agents.base import BaseAgent
 from agents.models import CoordinatorResponse
-from agents.parsing import extract_json_from_text
+from agents.parsing import extract_json_from_text, load_json
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +22,7 @@ class CoordinatorAgent(BaseAgent):
     that can be investigated separately.
     """
 
-    def __init__(self, client: Anthropic, system_prompt: str) -> None:
+    def __init__(self, client: "Anthropic", system_prompt: str) -> None:
         """
         Initialize the Coordinator agent.
 
@@ -55,7 +58,7 @@ class CoordinatorAgent(BaseAgent):
             logger.debug(f"Coordinator response: {response_text[:100]}...")
 
             json_text = extract_json_from_text(response_text)
-            subtasks_raw = json.loads(json_text)
+            subtasks_raw = load_json(json_text)
 
             if isinstance(subtasks_raw, list):
                 result = CoordinatorResponse(subtasks=subtasks_raw)
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field, field_validator
+from copy import deepcopy
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class Finding(BaseModel):
@@ -126,6 +128,9 @@ class WorkflowResult(BaseModel):
 class SearchResult(BaseModel):
     """A single search result from web search tool."""
 
+    # Instances are shared through the web search cache, so keep them immutable
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., description="Title of the search result")
     url: str = Field(..., description="URL of the search result")
     content: str = Field(..., description="Content snippet from the search result")
@@ -135,14 +140,23 @@ class SearchResult(BaseModel):
 class ToolSchema(BaseModel):
     """Schema definition for a tool that can be used by agents."""
 
+    # Tool schemas are module-level constants shared by every agent call.
+    # frozen only blocks reassigning fields; to_dict() copies the nested schema.
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Tool name")
     description: str = Field(..., description="Tool description for LLM")
     input_schema: dict = Field(..., description="JSON schema for tool inputs")
 
     def to_dict(self) -> dict:
-        """Convert to dictionary format expected by Anthropic API."""
+        """
+        Convert to dictionary format expected by Anthropic API.
+
+        The input schema is deep-copied so edits to the payload cannot leak
+        back into the shared tool definition.
+        """
         return {
             "name": self.name,
             "description": self.description,
-            "input_schema": self.input_schema
+            "input_schema": deepcopy(self.input_schema)
         }
@@ -8,6 +8,9 @@ Handles common issues with LLM-generated JSON including:
 """
 
 import logging
+from typing import Any
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -67,3 +70,25 @@ def extract_json_from_text(text: str) -> str:
         return text
 
     raise ValueError("Could not find valid JSON structure in response")
+
+
+def load_json(json_text: str) -> Any:
+    """
+    Parse a JSON string extracted from an LLM response.
+
+    Uses orjson, which parses agent-sized payloads roughly 2-3x faster than the
+    standard library. orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+    callers can keep catching the standard exception.
+
+    Args:
+        json_text: JSON string, typically from extract_json_from_text
+
+    Returns:
+        The decoded JSON value
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    value = orjson.loads(json_text)
+
+    return value
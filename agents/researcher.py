@@ -2,12 +2,15 @@
 
 import logging
 import json
-from typing import Any, Optional, Callable
-from anthropic import Anthropic
+import threading
+from typing import TYPE_CHECKING, Any, Optional, Callable
 
 from agents.base import BaseAgent
 from agents.models import ResearchResult
-from agents.parsing import extract_json_from_text
+from agents.parsing import extract_json_from_text, load_json
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +23,7 @@ class ResearcherAgent(BaseAgent):
     Can use web_search tool to find relevant information.
     """
 
-    def __init__(self, client: Anthropic, system_prompt: str) -> None:
+    def __init__(self, client: "Anthropic", system_prompt: str) -> None:
         """
         Initialize the Researcher agent.
 
@@ -34,7 +37,8 @@ class ResearcherAgent(BaseAgent):
         self,
         subtask: str,
         tools: Optional[list[dict[str, Any]]] = None,
-        tool_executor: Optional[Callable[[str, dict[str, Any]], Any]] = None
+        tool_executor: Optional[Callable[[str, dict[str, Any]], Any]] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> ResearchResult:
         """
         Research a specific subtask and return findings.
@@ -43,6 +47,7 @@ class ResearcherAgent(BaseAgent):
             subtask: The research subtask to investigate
             tools: Optional list of tools (e.g., web_search) the agent can use
             tool_executor: Optional function to execute tools
+            cancel_event: Optional event that stops further API calls once set
 
         Returns:
             ResearchResult with subtask and list of findings
@@ -58,14 +63,15 @@ class ResearcherAgent(BaseAgent):
                 max_tokens=4096,
                 temperature=1.0,
                 tools=tools,
-                tool_executor=tool_executor
+                tool_executor=tool_executor,
+                cancel_event=cancel_event
             )
 
             response_text = self.parse_response(response)
             logger.debug(f"Researcher response: {response_text[:100]}...")
 
             json_text = extract_json_from_text(response_text)
-            result_dict = json.loads(json_text)
+            result_dict = load_json(json_text)
 
             result = ResearchResult(**result_dict)
 
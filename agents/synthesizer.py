@@ -2,11 +2,14 @@
 
 import logging
 import json
-from anthropic import Anthropic
+from typing import TYPE_CHECKING
 
 from agents.base import BaseAgent
 from agents.models import ResearchResult, SynthesizedReport
-from agents.parsing import extract_json_from_text
+from agents.parsing import extract_json_from_text, load_json
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +22,7 @@ class SynthesizerAgent(BaseAgent):
     preserving source citations and creating a logical flow.
     """
 
-    def __init__(self, client: Anthropic, system_prompt: str) -> None:
+    def __init__(self, client: "Anthropic", system_prompt: str) -> None:
         """
         Initialize the Synthesizer agent.
 
@@ -60,7 +63,7 @@ class SynthesizerAgent(BaseAgent):
 
             response_text = self.parse_response(response)
             json_text = extract_json_from_text(response_text)
-            result_dict = json.loads(json_text)
+            result_dict = load_json(json_text)
 
             result = SynthesizedReport(**result_dict)
 
@@ -1,23 +1,62 @@
 """Orchestration workflow for multi-agent research system."""
 
 import logging
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Any
-from anthropic import Anthropic
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from agents.coordinator import CoordinatorAgent
 from agents.researcher import ResearcherAgent
 from agents.synthesizer import SynthesizerAgent
 from agents.critic import CriticAgent
-from agents.models import WorkflowResult
+from agents.models import ResearchResult, WorkflowResult
 from tools import WEB_SEARCH_TOOL, execute_web_search
 
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+
 logger = logging.getLogger(__name__)
 
+# Built once at import and passed by reference to every researcher call, across
+# threads; it is a plain list, so callers must treat it as read-only
+_RESEARCH_TOOLS = [WEB_SEARCH_TOOL.to_dict()]
+
+
+def _execute_tool(
+    tool_name: str, tool_input: dict[str, Any], tavily_api_key: str
+) -> list[dict[str, Any]]:
+    """
+    Execute tools requested by the researcher agent.
+
+    Returns results as list of dicts for Anthropic API compatibility.
+
+    Args:
+        tool_name: Name of the tool Claude asked for
+        tool_input: Input arguments from the tool_use block
+        tavily_api_key: Tavily API key for web search
+
+    Returns:
+        Tool results as plain dicts
+
+    Raises:
+        ValueError: If the tool is not known
+    """
+    if tool_name == "web_search":
+        search_query = tool_input["query"]
+        logger.info(f"Searching web for: {search_query}")
+        search_results = execute_web_search(search_query, tavily_api_key)
+        logger.debug(f"Found {len(search_results)} results")
+
+        return [result.model_dump() for result in search_results]
+    else:
+        raise ValueError(f"Unknown tool: {tool_name}")
+
 
 def run_research_workflow(
     query: str,
-    client: Anthropic,
+    client: "Anthropic",
     coordinator_prompt: str,
     researcher_prompt: str,
     synthesizer_prompt: str,
@@ -39,22 +78,6 @@ def run_research_workflow(
     Returns:
         WorkflowResult containing all research outputs
     """
-    def tool_executor(tool_name: str, tool_input: dict[str, Any]) -> list[dict[str, Any]]:
-        """
-        Execute tools requested by the researcher agent.
-
-        Returns results as list of dicts for Anthropic API compatibility.
-        """
-        if tool_name == "web_search":
-            search_query = tool_input["query"]
-            logger.info(f"Searching web for: {search_query}")
-            search_results = execute_web_search(search_query, tavily_api_key)
-            logger.debug(f"Found {len(search_results)} results")
-
-            return [result.model_dump() for result in search_results]
-        else:
-            raise ValueError(f"Unknown tool: {tool_name}")
-
     current_date = datetime.now().strftime("%B %d, %Y")
     current_year = datetime.now().year
     previous_year = current_year - 1
@@ -72,18 +95,57 @@ def run_research_workflow(
 
     logger.info(f"Starting research on {len(subtasks)} subtasks...")
     researcher = ResearcherAgent(client, researcher_prompt_with_date)
-    research_results = []
+    tool_executor = partial(_execute_tool, tavily_api_key=tavily_api_key)
 
-    for i, subtask in enumerate(subtasks, 1):
+    # Set when a subtask fails, so the other researchers make no further API calls
+    cancelled = threading.Event()
+
+    def research_subtask(i: int, subtask: str) -> ResearchResult:
+        """
+        Research one subtask on a worker thread.
+
+        Args:
+            i: 1-based position of the subtask, for progress logging
+            subtask: The research subtask to investigate
+
+        Returns:
+            ResearchResult for the subtask
+        """
         logger.info(f"[{i}/{len(subtasks)}] Researching subtask: {subtask}")
-        findings = researcher.research(
-            subtask,
-            tools=[WEB_SEARCH_TOOL.to_dict()],
-            tool_executor=tool_executor
-        )
-        research_results.append(findings)
+        try:
+            findings = researcher.research(
+                subtask,
+                tools=_RESEARCH_TOOLS,
+                tool_executor=tool_executor,
+                cancel_event=cancelled
+            )
+        except Exception:
+            cancelled.set()
+            raise
         logger.info(f"Completed subtask {i}/{len(subtasks)}")
 
+        return findings
+
+    # Subtasks are independent and latency-bound on the API, so research them
+    # concurrently; results are collected in subtask order.
+    executor = ThreadPoolExecutor(max_workers=len(subtasks))
+    futures = [
+        executor.submit(research_subtask, i, subtask)
+        for i, subtask in enumerate(subtasks, 1)
+    ]
+    try:
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        if not_done:
+            # A subtask failed: raise it now instead of waiting on the others
+            next(future for future in done if future.exception()).result()
+
+        research_results = [future.result() for future in futures]
+    finally:
+        # On failure, researchers still running stop before their next API call
+        # (a request already sent completes) and subtasks not yet started are dropped
+        cancelled.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
     logger.info("Synthesizing research findings...")
     synthesizer = SynthesizerAgent(client, synthesizer_prompt)
     synthesis = synthesizer.synthesize(research_results)
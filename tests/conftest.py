@@ -0,0 +1,74 @@
+"""Shared pytest fixtures for agent and workflow tests."""
+
+from types import SimpleNamespace
+from typing import Any, Callable
+from unittest.mock import Mock
+
+import pytest
+
+
+def _text_response(text: str, stop_reason: str = "end_turn") -> SimpleNamespace:
+    """
+    Build a stand-in for an Anthropic Message with a single text block.
+
+    Agents only read `.content`, `.stop_reason` and the block's `.text`, so a
+    SimpleNamespace is enough and avoids Mock(spec=...) introspection.
+
+    Args:
+        text: Text content of the response
+        stop_reason: Stop reason reported by the fake message
+
+    Returns:
+        Object shaped like an Anthropic Message
+    """
+    block = SimpleNamespace(type="text", text=text)
+    response = SimpleNamespace(content=[block], stop_reason=stop_reason)
+
+    return response
+
+
+def _tool_use_response(
+    name: str, tool_input: dict[str, Any], tool_use_id: str = "tool_123"
+) -> SimpleNamespace:
+    """
+    Build a stand-in for an Anthropic Message requesting a single tool call.
+
+    Args:
+        name: Name of the requested tool
+        tool_input: Input arguments for the tool
+        tool_use_id: ID of the tool_use block
+
+    Returns:
+        Object shaped like an Anthropic Message with stop_reason "tool_use"
+    """
+    block = SimpleNamespace(type="tool_use", name=name, input=tool_input, id=tool_use_id)
+    response = SimpleNamespace(content=[block], stop_reason="tool_use")
+
+    return response
+
+
+@pytest.fixture(scope="session")
+def make_text_response() -> Callable[..., SimpleNamespace]:
+    """Factory fixture for fake text responses from the Anthropic API."""
+    return _text_response
+
+
+@pytest.fixture(scope="session")
+def make_tool_use_response() -> Callable[..., SimpleNamespace]:
+    """Factory fixture for fake tool_use responses from the Anthropic API."""
+    return _tool_use_response
+
+
+@pytest.fixture
+def mock_client() -> SimpleNamespace:
+    """
+    Fresh stand-in for the Anthropic client, one per test.
+
+    Agents only touch `client.messages.create`, so that is the one real Mock;
+    tests configure its return_value/side_effect and assert on its calls.
+    Built per test rather than copied from a prototype, since copy.copy()
+    would share the configured child mocks between tests.
+    """
+    client = SimpleNamespace(messages=SimpleNamespace(create=Mock()))
+
+    return client
@@ -1,9 +1,9 @@
 """Unit tests for agent classes with Pydantic models."""
 
 import json
+import threading
 import pytest
-from unittest.mock import Mock
-from anthropic.types import Message, TextBlock
+from types import SimpleNamespace
 
 from agents.base import BaseAgent
 from agents.coordinator import CoordinatorAgent
@@ -18,126 +18,132 @@ from agents.models import (
     CriticIssue,
 )
 
+# Built once at import; the synthesizer only serializes its input.
+MINIMAL_FINDINGS = [
+    ResearchResult(
+        subtask="Test",
+        findings=[Finding(claim="Test", source="test.com", details="test")],
+    )
+]
 
-class TestBaseAgent:
-    """Tests for BaseAgent class."""
 
-    def test_init(self):
-        """Test BaseAgent initialization."""
-        client = Mock()
-        system_prompt = "You are a test agent"
+def _assert_coordinate_raises(
+    agent: CoordinatorAgent, response: SimpleNamespace, exc: type[Exception], match: str
+) -> None:
+    """Make the client return `response` and assert coordinate raises `exc`."""
+    agent.client.messages.create.return_value = response
 
-        agent = BaseAgent(client, system_prompt)
+    with pytest.raises(exc, match=match):
+        agent.coordinate("Test query")
 
-        assert agent.client == client
-        assert agent.system_prompt == system_prompt
-        assert agent.model == "claude-sonnet-4-5-20250929"
 
-    def test_init_with_custom_model(self):
-        """Test BaseAgent initialization with custom model."""
-        client = Mock()
+class TestBaseAgent:
+    """Tests for BaseAgent class."""
+
+    @pytest.mark.parametrize(
+        "model_kwarg, expected",
+        [
+            ({}, "claude-sonnet-4-5-20250929"),
+            ({"model": "claude-3-opus-20240229"}, "claude-3-opus-20240229"),
+        ],
+        ids=["default-model", "custom-model"],
+    )
+    def test_init(self, mock_client, model_kwarg, expected):
+        """Test BaseAgent initialization with default and custom models."""
         system_prompt = "You are a test agent"
-        custom_model = "claude-3-opus-20240229"
 
-        agent = BaseAgent(client, system_prompt, model=custom_model)
+        agent = BaseAgent(mock_client, system_prompt, **model_kwarg)
 
-        assert agent.model == custom_model
+        assert agent.client == mock_client
+        assert agent.system_prompt == system_prompt
+        assert agent.model == expected
 
-    def test_call_claude_without_tools(self):
-        """Test call_claude makes correct API call without tools."""
-        client = Mock()
-        mock_response = Mock(spec=Message)
-        mock_response.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_response
+    @pytest.mark.parametrize(
+        "tools",
+        [None, [{"name": "test_tool", "description": "A test tool"}]],
+        ids=["without-tools", "with-tools"],
+    )
+    def test_call_claude(self, mock_client, tools):
+        """Test call_claude makes correct API call with and without tools."""
+        mock_response = SimpleNamespace(stop_reason="end_turn")
+        mock_client.messages.create.return_value = mock_response
 
-        agent = BaseAgent(client, "Test prompt")
+        agent = BaseAgent(mock_client, "Test prompt")
 
-        response = agent.call_claude("Test message")
+        response = agent.call_claude("Test message", tools=tools)
 
-        assert response == mock_response
-        client.messages.create.assert_called_once_with(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=4096,
-            temperature=1.0,
-            system="Test prompt",
-            messages=[{"role": "user", "content": "Test message"}],
-        )
+        assert response is mock_response
+        assert mock_client.messages.create.call_count == 1
+        kwargs = mock_client.messages.create.call_args.kwargs
+        assert kwargs["model"] == "claude-sonnet-4-5-20250929"
+        assert kwargs["system"] == "Test prompt"
+        assert kwargs["messages"][0]["content"] == "Test message"
+        assert kwargs.get("tools") == tools
 
-    def test_call_claude_with_tools(self):
-        """Test call_claude makes correct API call with tools."""
-        client = Mock()
-        mock_response = Mock(spec=Message)
-        mock_response.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_response
+    def test_call_claude_cancelled(self, mock_client):
+        """Test call_claude makes no API call once the cancel event is set."""
+        cancel_event = threading.Event()
+        cancel_event.set()
 
-        agent = BaseAgent(client, "Test prompt")
-        tools = [{"name": "test_tool", "description": "A test tool"}]
+        agent = BaseAgent(mock_client, "Test prompt")
 
-        response = agent.call_claude("Test message", tools=tools)
+        with pytest.raises(RuntimeError, match="Cancelled"):
+            agent.call_claude("Test message", cancel_event=cancel_event)
 
-        assert response == mock_response
-        client.messages.create.assert_called_once_with(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=4096,
-            temperature=1.0,
-            system="Test prompt",
-            messages=[{"role": "user", "content": "Test message"}],
-            tools=tools,
-        )
+        mock_client.messages.create.assert_not_called()
 
-    def test_parse_response_success(self):
+    def test_parse_response_success(self, mock_client, make_text_response):
         """Test parse_response extracts text correctly."""
-        client = Mock()
-        agent = BaseAgent(client, "Test prompt")
+        agent = BaseAgent(mock_client, "Test prompt")
 
-        mock_text_block = Mock(spec=TextBlock)
-        mock_text_block.text = "Test response text"
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
+        mock_message = make_text_response("Test response text")
 
         result = agent.parse_response(mock_message)
 
         assert result == "Test response text"
 
-    def test_parse_response_no_content(self):
+    def test_parse_response_no_content(self, mock_client):
         """Test parse_response raises error when no content."""
-        client = Mock()
-        agent = BaseAgent(client, "Test prompt")
+        agent = BaseAgent(mock_client, "Test prompt")
 
-        mock_message = Mock(spec=Message)
-        mock_message.content = []
+        mock_message = SimpleNamespace(content=[])
 
         with pytest.raises(ValueError, match="Message has no content"):
             agent.parse_response(mock_message)
 
+    def test_parse_response_unexpected_type(self, mock_client):
+        """Test parse_response raises error when first block has no text."""
+        agent = BaseAgent(mock_client, "Test prompt")
+
+        class _Blank:
+            pass
+
+        mock_message = SimpleNamespace(content=[_Blank()])
+
+        with pytest.raises(ValueError, match="Unexpected content block type"):
+            agent.parse_response(mock_message)
+
 
 class TestCoordinatorAgent:
     """Tests for CoordinatorAgent class with Pydantic models."""
 
-    def test_init(self):
+    def test_init(self, mock_client):
         """Test CoordinatorAgent initialization."""
-        client = Mock()
         system_prompt = "You are a coordinator"
 
-        agent = CoordinatorAgent(client, system_prompt)
+        agent = CoordinatorAgent(mock_client, system_prompt)
 
-        assert agent.client == client
+        assert agent.client == mock_client
         assert agent.system_prompt == system_prompt
 
-    def test_coordinate_success(self):
+    def test_coordinate_success(self, mock_client, make_text_response):
         """Test coordinate successfully returns list of subtasks."""
-        client = Mock()
-        agent = CoordinatorAgent(client, "Test prompt")
+        agent = CoordinatorAgent(mock_client, "Test prompt")
 
         # Mock response with proper JSON structure for Pydantic
-        mock_text_block = Mock(spec=TextBlock)
-        mock_text_block.text = json.dumps(
-            {"subtasks": ["Subtask 1", "Subtask 2", "Subtask 3"]}
+        mock_client.messages.create.return_value = make_text_response(
+            json.dumps({"subtasks": ["Subtask 1", "Subtask 2", "Subtask 3"]})
         )
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
 
         result = agent.coordinate("Test query")
 
@@ -145,72 +151,56 @@ class TestCoordinatorAgent:
         assert len(result) == 3
         assert result == ["Subtask 1", "Subtask 2", "Subtask 3"]
 
-    def test_coordinate_strips_markdown(self):
+    def test_coordinate_strips_markdown(self, mock_client, make_text_response):
         """Test coordinate strips markdown code blocks."""
-        client = Mock()
-        agent = CoordinatorAgent(client, "Test prompt")
+        agent = CoordinatorAgent(mock_client, "Test prompt")
 
-        mock_text_block = Mock(spec=TextBlock)
-        mock_text_block.text = '```json\n{"subtasks": ["Task 1", "Task 2"]}\n```'
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
+        mock_client.messages.create.return_value = make_text_response(
+            '```json\n{"subtasks": ["Task 1", "Task 2"]}\n```'
+        )
 
         result = agent.coordinate("Test query")
 
         assert result == ["Task 1", "Task 2"]
 
-    def test_coordinate_validates_min_subtasks(self):
-        """Test coordinate validates minimum subtasks through Pydantic."""
-        client = Mock()
-        agent = CoordinatorAgent(client, "Test prompt")
-
-        mock_text_block = Mock(spec=TextBlock)
-        mock_text_block.text = json.dumps({"subtasks": ["Only one"]})
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
-
-        with pytest.raises(RuntimeError, match="Coordination failed"):
-            agent.coordinate("Test query")
-
-    def test_coordinate_validates_max_subtasks(self):
-        """Test coordinate validates maximum subtasks through Pydantic."""
-        client = Mock()
-        agent = CoordinatorAgent(client, "Test prompt")
-
-        mock_text_block = Mock(spec=TextBlock)
-        mock_text_block.text = json.dumps(
-            {"subtasks": ["Task 1", "Task 2", "Task 3", "Task 4", "Task 5"]}
-        )
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
-
-        with pytest.raises(RuntimeError, match="Coordination failed"):
-            agent.coordinate("Test query")
+    @pytest.mark.parametrize(
+        "text, exc, match",
+        [
+            (json.dumps({"subtasks": ["Only one"]}), RuntimeError, "Coordination failed"),
+            (
+                json.dumps({"subtasks": ["Task 1", "Task 2", "Task 3", "Task 4", "Task 5"]}),
+                RuntimeError,
+                "Coordination failed",
+            ),
+            (json.dumps({"tasks": ["Task 1", "Task 2"]}), RuntimeError, "Unexpected JSON format"),
+            ('{"subtasks": ["Task 1",', ValueError, "Failed to parse response as JSON"),
+        ],
+        ids=["too-few-subtasks", "too-many-subtasks", "missing-subtasks-key", "malformed-json"],
+    )
+    def test_coordinate_rejects_invalid_response(
+        self, mock_client, make_text_response, text, exc, match
+    ):
+        """Test coordinate surfaces validation and parsing failures."""
+        agent = CoordinatorAgent(mock_client, "Test prompt")
+
+        _assert_coordinate_raises(agent, make_text_response(text), exc, match)
 
 
 class TestSynthesizerAgent:
     """Tests for SynthesizerAgent class with Pydantic models."""
 
-    def test_init(self):
+    def test_init(self, mock_client):
         """Test SynthesizerAgent initialization."""
-        client = Mock()
         system_prompt = "You are a synthesizer"
 
-        agent = SynthesizerAgent(client, system_prompt)
+        agent = SynthesizerAgent(mock_client, system_prompt)
 
-        assert agent.client == client
+        assert agent.client == mock_client
         assert agent.system_prompt == system_prompt
 
-    def test_synthesize_success(self):
+    def test_synthesize_success(self, mock_client, make_text_response):
         """Test synthesize successfully returns SynthesizedReport."""
-        client = Mock()
-        agent = SynthesizerAgent(client, "Test prompt")
+        agent = SynthesizerAgent(mock_client, "Test prompt")
 
         # Create Pydantic model input
         findings = [
@@ -227,24 +217,21 @@ class TestSynthesizerAgent:
         ]
 
         # Mock response
-        mock_text_block = Mock(spec=TextBlock)
-        mock_text_block.text = json.dumps(
-            {
-                "summary": "AI research summary",
-                "sections": [
-                    {
-                        "title": "AI Section",
-                        "content": "Content here",
-                        "sources": ["https://example.com"],
-                    }
-                ],
-                "key_insights": ["Insight 1", "Insight 2"],
-            }
+        mock_client.messages.create.return_value = make_text_response(
+            json.dumps(
+                {
+                    "summary": "AI research summary",
+                    "sections": [
+                        {
+                            "title": "AI Section",
+                            "content": "Content here",
+                            "sources": ["https://example.com"],
+                        }
+                    ],
+                    "key_insights": ["Insight 1", "Insight 2"],
+                }
+            )
         )
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
 
         result = agent.synthesize(findings)
 
@@ -255,31 +242,20 @@ class TestSynthesizerAgent:
         assert result.sections[0].title == "AI Section"
         assert len(result.key_insights) == 2
 
-    def test_synthesize_strips_markdown(self):
+    def test_synthesize_strips_markdown(self, mock_client, make_text_response):
         """Test synthesize handles markdown code blocks."""
-        client = Mock()
-        agent = SynthesizerAgent(client, "Test prompt")
-
-        findings = [
-            ResearchResult(
-                subtask="Test",
-                findings=[Finding(claim="Test", source="test.com", details="test")],
-            )
-        ]
+        agent = SynthesizerAgent(mock_client, "Test prompt")
 
-        mock_text_block = Mock(spec=TextBlock)
         response_json = {
             "summary": "Test summary",
             "sections": [{"title": "Test", "content": "Content", "sources": []}],
             "key_insights": ["Insight 1"],
         }
-        mock_text_block.text = f"```json\n{json.dumps(response_json)}\n```"
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
+        mock_client.messages.create.return_value = make_text_response(
+            f"```json\n{json.dumps(response_json)}\n```"
+        )
 
-        result = agent.synthesize(findings)
+        result = agent.synthesize(MINIMAL_FINDINGS)
 
         assert result.summary == "Test summary"
         assert len(result.sections) == 1
@@ -288,20 +264,18 @@ class TestSynthesizerAgent:
 class TestCriticAgent:
     """Tests for CriticAgent class with Pydantic models."""
 
-    def test_init(self):
+    def test_init(self, mock_client):
         """Test CriticAgent initialization."""
-        client = Mock()
         system_prompt = "You are a critic"
 
-        agent = CriticAgent(client, system_prompt)
+        agent = CriticAgent(mock_client, system_prompt)
 
-        assert agent.client == client
+        assert agent.client == mock_client
         assert agent.system_prompt == system_prompt
 
-    def test_review_success(self):
+    def test_review_success(self, mock_client, make_text_response):
         """Test review successfully returns CriticReview."""
-        client = Mock()
-        agent = CriticAgent(client, "Test prompt")
+        agent = CriticAgent(mock_client, "Test prompt")
 
         # Create Pydantic model input
         report = SynthesizedReport(
@@ -313,26 +287,23 @@ class TestCriticAgent:
         )
 
         # Mock response
-        mock_text_block = Mock(spec=TextBlock)
-        mock_text_block.text = json.dumps(
-            {
-                "overall_quality": "Good",
-                "issues": [
-                    {
-                        "type": "gap",
-                        "description": "Missing info",
-                        "location": "Section 1",
-                        "severity": "medium",
-                    }
-                ],
-                "suggestions": ["Add more sources"],
-                "needs_more_research": True,
-            }
+        mock_client.messages.create.return_value = make_text_response(
+            json.dumps(
+                {
+                    "overall_quality": "Good",
+                    "issues": [
+                        {
+                            "type": "gap",
+                            "description": "Missing info",
+                            "location": "Section 1",
+                            "severity": "medium",
+                        }
+                    ],
+                    "suggestions": ["Add more sources"],
+                    "needs_more_research": True,
+                }
+            )
         )
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
 
         result = agent.review(report)
 
@@ -356,10 +327,9 @@ class TestCriticAgent:
 
         assert issue.formatted_type == "Unsupported Claim"
 
-    def test_review_strips_markdown(self):
+    def test_review_strips_markdown(self, mock_client, make_text_response):
         """Test review handles markdown code blocks."""
-        client = Mock()
-        agent = CriticAgent(client, "Test prompt")
+        agent = CriticAgent(mock_client, "Test prompt")
 
         report = SynthesizedReport(
             summary="Test",
@@ -367,18 +337,15 @@ class TestCriticAgent:
             key_insights=[],
         )
 
-        mock_text_block = Mock(spec=TextBlock)
         response_json = {
             "overall_quality": "Good",
             "issues": [],
             "suggestions": [],
             "needs_more_research": False,
         }
-        mock_text_block.text = f"```json\n{json.dumps(response_json)}\n```"
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
+        mock_client.messages.create.return_value = make_text_response(
+            f"```json\n{json.dumps(response_json)}\n```"
+        )
 
         result = agent.review(report)
 
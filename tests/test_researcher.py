@@ -3,48 +3,49 @@
 import json
 import pytest
 from unittest.mock import Mock
-from anthropic.types import Message, TextBlock, ToolUseBlock
 
 from agents.researcher import ResearcherAgent
 from agents.models import ResearchResult, Finding
 
+# Response payloads are serialized once at import rather than per test.
+GPT4_JSON = json.dumps(
+    {
+        "subtask": "Research AI",
+        "findings": [
+            {
+                "claim": "GPT-4 released in 2023",
+                "source": "https://example.com/gpt4",
+                "details": "Major language model advancement",
+            }
+        ],
+    }
+)
+MARKDOWN_WRAPPED_JSON = f"```json\n{GPT4_JSON}\n```"
+NOT_A_LIST_JSON = json.dumps({"subtask": "Test", "findings": "not a list"})
+EMPTY_FINDINGS_JSON = json.dumps({"subtask": "Test", "findings": []})
+
+
+@pytest.fixture
+def agent(mock_client):
+    """ResearcherAgent wired to a fresh mock client."""
+    return ResearcherAgent(mock_client, "Test prompt")
+
 
 class TestResearcherAgent:
     """Tests for ResearcherAgent class with Pydantic models."""
 
-    def test_init(self):
+    def test_init(self, mock_client):
         """Test ResearcherAgent initialization."""
-        client = Mock()
         system_prompt = "You are a researcher"
 
-        agent = ResearcherAgent(client, system_prompt)
+        agent = ResearcherAgent(mock_client, system_prompt)
 
-        assert agent.client == client
+        assert agent.client == mock_client
         assert agent.system_prompt == system_prompt
 
-    def test_research_success(self):
+    def test_research_success(self, agent, make_text_response):
         """Test research successfully returns ResearchResult."""
-        client = Mock()
-        agent = ResearcherAgent(client, "Test prompt")
-
-        # Mock response
-        mock_text_block = Mock(spec=TextBlock)
-        mock_text_block.text = json.dumps(
-            {
-                "subtask": "Research AI",
-                "findings": [
-                    {
-                        "claim": "GPT-4 released in 2023",
-                        "source": "https://example.com/gpt4",
-                        "details": "Major language model advancement",
-                    }
-                ],
-            }
-        )
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
+        agent.client.messages.create.return_value = make_text_response(GPT4_JSON)
 
         result = agent.research("Research AI breakthroughs")
 
@@ -56,48 +57,21 @@ class TestResearcherAgent:
         assert result.findings[0].claim == "GPT-4 released in 2023"
         assert result.findings[0].source == "https://example.com/gpt4"
 
-    def test_research_strips_markdown(self):
+    def test_research_strips_markdown(self, agent, make_text_response):
         """Test research handles markdown code blocks."""
-        client = Mock()
-        agent = ResearcherAgent(client, "Test prompt")
-
-        mock_text_block = Mock(spec=TextBlock)
-        response_json = {
-            "subtask": "Test task",
-            "findings": [
-                {"claim": "Test claim", "source": "test.com", "details": "Test details"}
-            ],
-        }
-        mock_text_block.text = f"```json\n{json.dumps(response_json)}\n```"
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
-
-        result = agent.research("Test task")
-
-        assert result.subtask == "Test task"
+        agent.client.messages.create.return_value = make_text_response(
+            MARKDOWN_WRAPPED_JSON
+        )
+
+        result = agent.research("Research AI breakthroughs")
+
+        assert result.subtask == "Research AI"
         assert len(result.findings) == 1
 
-    def test_research_with_tools(self):
+    def test_research_with_tools(self, agent, make_text_response):
         """Test research can be called with tools."""
-        client = Mock()
-        agent = ResearcherAgent(client, "Test prompt")
-
         # Mock response without tool use
-        mock_text_block = Mock(spec=TextBlock)
-        mock_text_block.text = json.dumps(
-            {
-                "subtask": "Test",
-                "findings": [
-                    {"claim": "Test", "source": "test.com", "details": "Test"}
-                ],
-            }
-        )
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
+        agent.client.messages.create.return_value = make_text_response(GPT4_JSON)
 
         tools = [{"name": "web_search", "description": "Search the web"}]
         tool_executor = Mock(return_value=[])
@@ -106,41 +80,32 @@ class TestResearcherAgent:
 
         assert isinstance(result, ResearchResult)
         # Verify tools were passed to API
-        call_args = client.messages.create.call_args
+        call_args = agent.client.messages.create.call_args
         assert "tools" in call_args.kwargs
         assert call_args.kwargs["tools"] == tools
 
-    def test_research_with_tool_use(self):
+    def test_research_with_tool_use(
+        self, agent, make_text_response, make_tool_use_response
+    ):
         """Test research handles tool use in response."""
-        client = Mock()
-        agent = ResearcherAgent(client, "Test prompt")
-
         # First response: Claude wants to use a tool
-        mock_tool_block = Mock(spec=ToolUseBlock)
-        mock_tool_block.type = "tool_use"
-        mock_tool_block.name = "web_search"
-        mock_tool_block.input = {"query": "AI developments"}
-        mock_tool_block.id = "tool_123"
-
-        mock_message_1 = Mock(spec=Message)
-        mock_message_1.content = [mock_tool_block]
-        mock_message_1.stop_reason = "tool_use"
+        mock_message_1 = make_tool_use_response(
+            "web_search", {"query": "AI developments"}, "tool_123"
+        )
 
         # Second response: Final answer with findings
-        mock_text_block = Mock(spec=TextBlock)
-        mock_text_block.text = json.dumps(
-            {
-                "subtask": "Research AI",
-                "findings": [
-                    {"claim": "Found via tool", "source": "tool.com", "details": "Data"}
-                ],
-            }
+        mock_message_2 = make_text_response(
+            json.dumps(
+                {
+                    "subtask": "Research AI",
+                    "findings": [
+                        {"claim": "Found via tool", "source": "tool.com", "details": "Data"}
+                    ],
+                }
+            )
         )
-        mock_message_2 = Mock(spec=Message)
-        mock_message_2.content = [mock_text_block]
-        mock_message_2.stop_reason = "end_turn"
 
-        client.messages.create.side_effect = [mock_message_1, mock_message_2]
+        agent.client.messages.create.side_effect = [mock_message_1, mock_message_2]
 
         tools = [{"name": "web_search"}]
         tool_executor = Mock(return_value=[{"title": "Result", "url": "url.com"}])
@@ -153,61 +118,56 @@ class TestResearcherAgent:
         assert result.subtask == "Research AI"
         assert result.findings[0].claim == "Found via tool"
 
-    def test_research_validates_findings_list(self):
-        """Test research validates findings is a list through Pydantic."""
-        client = Mock()
-        agent = ResearcherAgent(client, "Test prompt")
-
-        # Mock response with invalid findings (not a list)
-        mock_text_block = Mock(spec=TextBlock)
-        mock_text_block.text = json.dumps(
-            {"subtask": "Test", "findings": "not a list"}
+    def test_research_reports_tool_executor_error(
+        self, agent, make_text_response, make_tool_use_response
+    ):
+        """Test a failing tool is reported back to Claude instead of aborting research."""
+        mock_message_1 = make_tool_use_response(
+            "web_search", {"query": "AI developments"}, "tool_123"
         )
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
-
-        with pytest.raises(RuntimeError, match="Research failed"):
-            agent.research("Test task")
 
-    def test_research_validates_min_findings(self):
-        """Test research validates at least one finding through Pydantic."""
-        client = Mock()
-        agent = ResearcherAgent(client, "Test prompt")
-
-        # Mock response with empty findings list
-        mock_text_block = Mock(spec=TextBlock)
-        mock_text_block.text = json.dumps({"subtask": "Test", "findings": []})
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
-
-        with pytest.raises(RuntimeError, match="Research failed"):
-            agent.research("Test task")
+        mock_message_2 = make_text_response(
+            json.dumps(
+                {
+                    "subtask": "Research AI",
+                    "findings": [
+                        {"claim": "Answered anyway", "source": "memory", "details": "Data"}
+                    ],
+                }
+            )
+        )
 
-    def test_research_handles_api_error(self):
-        """Test research handles API errors gracefully."""
-        client = Mock()
-        agent = ResearcherAgent(client, "Test prompt")
+        agent.client.messages.create.side_effect = [mock_message_1, mock_message_2]
 
-        client.messages.create.side_effect = Exception("API Error")
+        tools = [{"name": "web_search"}]
+        tool_executor = Mock(side_effect=Exception("Search backend down"))
 
-        with pytest.raises(RuntimeError, match="Research failed"):
-            agent.research("Test task")
+        result = agent.research("Research AI", tools=tools, tool_executor=tool_executor)
 
-    def test_research_handles_invalid_json(self):
-        """Test research handles invalid JSON responses."""
-        client = Mock()
-        agent = ResearcherAgent(client, "Test prompt")
-
-        mock_text_block = Mock(spec=TextBlock)
-        mock_text_block.text = "Not valid JSON at all"
-        mock_message = Mock(spec=Message)
-        mock_message.content = [mock_text_block]
-        mock_message.stop_reason = "end_turn"
-        client.messages.create.return_value = mock_message
+        assert result.findings[0].claim == "Answered anyway"
+        # Second API call carries the error back as a tool_result
+        followup_messages = agent.client.messages.create.call_args.kwargs["messages"]
+        tool_result = followup_messages[-1]["content"][0]
+        assert tool_result["tool_use_id"] == "tool_123"
+        assert tool_result["is_error"] is True
+        assert "Search backend down" in tool_result["content"]
+
+    @pytest.mark.parametrize(
+        "payload, side_effect",
+        [
+            (NOT_A_LIST_JSON, None),
+            (EMPTY_FINDINGS_JSON, None),
+            ("Not valid JSON at all", None),
+            (None, Exception("API Error")),
+        ],
+        ids=["findings-not-list", "empty-findings", "invalid-json", "api-error"],
+    )
+    def test_research_failure_modes(self, agent, make_text_response, payload, side_effect):
+        """Test research wraps validation, parsing and API failures in RuntimeError."""
+        if side_effect is not None:
+            agent.client.messages.create.side_effect = side_effect
+        else:
+            agent.client.messages.create.return_value = make_text_response(payload)
 
         with pytest.raises(RuntimeError, match="Research failed"):
             agent.research("Test task")
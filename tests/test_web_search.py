@@ -0,0 +1,170 @@
+"""Unit tests for the Tavily web search tool."""
+
+import threading
+from concurrent.futures import Future
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from pydantic import ValidationError
+
+from agents.models import SearchResult
+from tools import web_search
+from tools.web_search import WEB_SEARCH_TOOL, execute_web_search
+
+TAVILY_RESPONSE = {
+    "results": [
+        {
+            "title": "Result",
+            "url": "https://example.com",
+            "content": "Content",
+            "score": 0.9,
+        }
+    ]
+}
+
+
+@pytest.fixture
+def tavily(monkeypatch):
+    """Stand-in Tavily client returned for every API key; caches start empty."""
+    client = SimpleNamespace(search=Mock(return_value=TAVILY_RESPONSE))
+    monkeypatch.setattr(web_search, "_get_client", lambda api_key: client)
+    web_search._clear_cache()
+
+    yield client
+
+    web_search._clear_cache()
+
+
+class TestExecuteWebSearch:
+    """Tests for execute_web_search."""
+
+    def test_returns_search_results(self, tavily):
+        """Test Tavily results are converted to SearchResult models."""
+        results = execute_web_search("AI news", "test_key")
+
+        assert results == [
+            SearchResult(
+                title="Result", url="https://example.com", content="Content", score=0.9
+            )
+        ]
+        # Normalization only keys the cache; Tavily gets the query as typed
+        tavily.search.assert_called_once_with(
+            query="AI news", search_depth="basic", max_results=5
+        )
+
+    def test_repeated_query_is_cached(self, tavily):
+        """Test queries differing only in case and whitespace hit Tavily once."""
+        first = execute_web_search("AI news", "test_key")
+        second = execute_web_search("  ai   NEWS ", "test_key")
+
+        assert second == first
+        assert second is not first
+        tavily.search.assert_called_once_with(
+            query="AI news", search_depth="basic", max_results=5
+        )
+
+        # Cached results are shared between callers, so they must be read-only
+        with pytest.raises(ValidationError):
+            first[0].title = "Changed"
+
+    def test_failed_search_is_not_cached(self, tavily):
+        """Test a failing search raises and is retried on the next call."""
+        tavily.search.side_effect = [Exception("Rate limited"), TAVILY_RESPONSE]
+
+        with pytest.raises(Exception, match="Rate limited"):
+            execute_web_search("AI news", "test_key")
+
+        assert len(execute_web_search("AI news", "test_key")) == 1
+        assert tavily.search.call_count == 2
+
+    def test_interrupted_search_is_not_left_in_flight(self, tavily):
+        """Test a search ending in a BaseException does not block later callers."""
+
+        class _Abort(BaseException):
+            pass
+
+        tavily.search.side_effect = [_Abort(), TAVILY_RESPONSE]
+
+        with pytest.raises(_Abort):
+            execute_web_search("AI news", "test_key")
+
+        assert web_search._in_flight == {}
+        assert len(execute_web_search("AI news", "test_key")) == 1
+
+    def test_concurrent_searches_are_coalesced(self, tavily, monkeypatch):
+        """Test a search already in flight is awaited rather than sent again."""
+        entered = threading.Event()
+        release = threading.Event()
+        waiting = threading.Event()
+
+        def slow_search(**kwargs):
+            entered.set()
+            release.wait(timeout=5)
+            return TAVILY_RESPONSE
+
+        tavily.search.side_effect = slow_search
+
+        class _SignallingFuture(Future):
+            """Future that reports when a second caller starts waiting on it."""
+
+            def result(self, timeout=None):
+                waiting.set()
+                return super().result(timeout)
+
+        monkeypatch.setattr(web_search, "Future", _SignallingFuture)
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda q=q: results.append(execute_web_search(q, "test_key"))
+            )
+            for q in ("AI news", "ai news")
+        ]
+
+        threads[0].start()
+        assert entered.wait(timeout=5)
+        threads[1].start()
+        assert waiting.wait(timeout=5)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(results) == 2
+        assert results[0] == results[1]
+        assert tavily.search.call_count == 1
+
+
+class TestGetClient:
+    """Tests for the shared Tavily client factory."""
+
+    def test_client_reused_per_api_key(self, monkeypatch):
+        """Test one TavilyClient is built per API key and then reused."""
+        tavily_client = Mock(side_effect=lambda api_key: SimpleNamespace(api_key=api_key))
+        monkeypatch.setattr(web_search, "TavilyClient", tavily_client)
+        web_search._get_client.cache_clear()
+
+        try:
+            first = web_search._get_client("key_a")
+            assert web_search._get_client("key_a") is first
+            assert web_search._get_client("key_b") is not first
+            assert tavily_client.call_count == 2
+        finally:
+            web_search._get_client.cache_clear()
+
+
+class TestWebSearchTool:
+    """Tests for the shared web_search tool schema."""
+
+    def test_fields_cannot_be_reassigned(self):
+        """Test the shared tool schema cannot be reassigned."""
+        with pytest.raises(ValidationError):
+            WEB_SEARCH_TOOL.name = "other_tool"
+
+    def test_to_dict_copies_input_schema(self):
+        """Test edits to an API payload do not reach the shared schema."""
+        payload = WEB_SEARCH_TOOL.to_dict()
+        payload["input_schema"]["required"].append("max_results")
+
+        assert WEB_SEARCH_TOOL.input_schema["required"] == ["query"]
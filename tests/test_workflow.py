@@ -1,109 +1,235 @@
 """Integration tests for workflow orchestration with Pydantic models."""
 
-import json
-import pytest
-from unittest.mock import Mock, patch
-from anthropic.types import Message, TextBlock
-
-from orchestration.workflow import run_research_workflow
-from agents.models import WorkflowResult, ResearchResult, SynthesizedReport, CriticReview, SearchResult
-
-
-class TestWorkflow:
-    """Tests for research workflow integration with Pydantic models."""
-
-    @patch("orchestration.workflow.execute_web_search")
-    def test_run_research_workflow_success(self, mock_web_search):
-        """Test complete workflow returns WorkflowResult."""
-        client = Mock()
+import threading
 
-        # Mock web search tool - returns SearchResult Pydantic models
+import pytest
+from unittest.mock import Mock
+
+from orchestration.workflow import _RESEARCH_TOOLS, _execute_tool, run_research_workflow
+from tools import WEB_SEARCH_TOOL
+from agents.models import (
+    WorkflowResult,
+    CoordinatorResponse,
+    ResearchResult,
+    SynthesizedReport,
+    CriticReview,
+    SearchResult,
+    Finding,
+    SynthesisSection,
+)
+
+# Pre-encoded response payloads; test_payloads_match_models keeps them honest.
+COORD_JSON = '{"subtasks": ["Subtask 1", "Subtask 2"]}'
+RESEARCH_1_JSON = (
+    '{"subtask": "Subtask 1", "findings": '
+    '[{"claim": "Claim 1", "source": "source1.com", "details": "Details 1"}]}'
+)
+RESEARCH_2_JSON = (
+    '{"subtask": "Subtask 2", "findings": '
+    '[{"claim": "Claim 2", "source": "source2.com", "details": "Details 2"}]}'
+)
+SYNTH_JSON = (
+    '{"summary": "Research summary", '
+    '"sections": [{"title": "Section 1", "content": "Section content", '
+    '"sources": ["source1.com"]}], '
+    '"key_insights": ["Insight 1", "Insight 2"]}'
+)
+CRITIC_JSON = (
+    '{"overall_quality": "Good", "issues": [], '
+    '"suggestions": ["Add more sources"], "needs_more_research": false}'
+)
+
+# model_dump() of the WorkflowResult built from the payloads above.
+EXPECTED_WORKFLOW_RESULT = {
+    "query": "Test query",
+    "subtasks": ["Subtask 1", "Subtask 2"],
+    "research_results": [
+        {
+            "subtask": "Subtask 1",
+            "findings": [
+                {"claim": "Claim 1", "source": "source1.com", "details": "Details 1"}
+            ],
+        },
+        {
+            "subtask": "Subtask 2",
+            "findings": [
+                {"claim": "Claim 2", "source": "source2.com", "details": "Details 2"}
+            ],
+        },
+    ],
+    "synthesis": {
+        "summary": "Research summary",
+        "sections": [
+            {
+                "title": "Section 1",
+                "content": "Section content",
+                "sources": ["source1.com"],
+            }
+        ],
+        "key_insights": ["Insight 1", "Insight 2"],
+    },
+    "critique": {
+        "overall_quality": "Good",
+        "issues": [],
+        "suggestions": ["Add more sources"],
+        "needs_more_research": False,
+    },
+}
+
+
+@pytest.fixture
+def mock_web_search(monkeypatch):
+    """Replace the workflow's web search so no Tavily calls are made."""
+    mock = Mock()
+    monkeypatch.setattr("orchestration.workflow.execute_web_search", mock)
+
+    return mock
+
+
+def _route_replies(replies, on_research=None):
+    """
+    Build a messages.create side_effect that answers by prompt, not call order.
+
+    Researcher calls run concurrently, so each call is routed by its system
+    prompt, falling back to the first user message (the subtask) for
+    researchers, whose prompt embeds the current date. Replies for a key are
+    returned in order, so a tool_use turn can precede the final answer; an
+    exception in place of a reply is raised instead. `on_research`, if given,
+    is called with the subtask before each researcher reply.
+    """
+    queues = {key: list(value) for key, value in replies.items()}
+
+    def create(**kwargs):
+        key = kwargs["system"]
+        if key not in queues:
+            key = kwargs["messages"][0]["content"]
+            if on_research is not None:
+                on_research(key)
+
+        reply = queues[key].pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+
+        return reply
+
+    return create
+
+
+@pytest.fixture(scope="module")
+def workflow_responses(make_text_response):
+    """
+    Scripted replies keyed by system prompt, or by subtask for researchers.
+
+    Built once per module; the workflow only reads these, so cases can share them.
+    """
+    responses = {
+        "Coordinator prompt": (make_text_response(COORD_JSON),),
+        "Subtask 1": (make_text_response(RESEARCH_1_JSON),),
+        "Subtask 2": (make_text_response(RESEARCH_2_JSON),),
+        "Synthesizer prompt": (make_text_response(SYNTH_JSON),),
+        "Critic prompt": (make_text_response(CRITIC_JSON),),
+    }
+
+    return responses
+
+
+@pytest.fixture(scope="module")
+def sample_workflow_result():
+    """Validated WorkflowResult shared by read-only structure tests."""
+    result = WorkflowResult(
+        query="Test query",
+        subtasks=["Task 1", "Task 2"],
+        research_results=[
+            ResearchResult(
+                subtask="Task 1",
+                findings=[
+                    Finding(claim="Claim", source="source.com", details="Details")
+                ],
+            )
+        ],
+        synthesis=SynthesizedReport(
+            summary="Summary",
+            sections=[
+                SynthesisSection(title="Section", content="Content", sources=[])
+            ],
+            key_insights=["Insight"],
+        ),
+        critique=CriticReview(
+            overall_quality="Good",
+            issues=[],
+            suggestions=[],
+            needs_more_research=False,
+        ),
+    )
+
+    return result
+
+
+class TestPayloads:
+    """Sanity checks for the pre-encoded agent replies."""
+
+    @pytest.mark.parametrize(
+        "payload, model",
+        [
+            (COORD_JSON, CoordinatorResponse),
+            (RESEARCH_1_JSON, ResearchResult),
+            (RESEARCH_2_JSON, ResearchResult),
+            (SYNTH_JSON, SynthesizedReport),
+            (CRITIC_JSON, CriticReview),
+        ],
+        ids=["coordinator", "research-1", "research-2", "synthesis", "critique"],
+    )
+    def test_payloads_match_models(self, payload, model):
+        """Test the inlined JSON payloads validate against the agents' models."""
+        model.model_validate_json(payload)
+
+
+class TestExecuteTool:
+    """Unit tests for the workflow's tool dispatcher."""
+
+    def test_web_search_returns_dicts(self, mock_web_search):
+        """Test web_search requests are forwarded to Tavily and dumped to dicts."""
         mock_web_search.return_value = [
-            SearchResult(title="Result", url="https://example.com", content="Content", score=0.9)
+            SearchResult.model_construct(
+                title="Result", url="https://example.com", content="Content", score=0.9
+            )
         ]
 
-        # Mock coordinator response
-        mock_coord_text = Mock(spec=TextBlock)
-        mock_coord_text.text = json.dumps(
-            {"subtasks": ["Subtask 1", "Subtask 2"]}
-        )
-        mock_coord_message = Mock(spec=Message)
-        mock_coord_message.content = [mock_coord_text]
-        mock_coord_message.stop_reason = "end_turn"
+        results = _execute_tool("web_search", {"query": "test query"}, "test_key")
 
-        # Mock researcher responses (2 subtasks)
-        mock_research_text_1 = Mock(spec=TextBlock)
-        mock_research_text_1.text = json.dumps(
+        mock_web_search.assert_called_once_with("test query", "test_key")
+        assert results == [
             {
-                "subtask": "Subtask 1",
-                "findings": [
-                    {"claim": "Claim 1", "source": "source1.com", "details": "Details 1"}
-                ],
+                "title": "Result",
+                "url": "https://example.com",
+                "content": "Content",
+                "score": 0.9,
             }
-        )
-        mock_research_message_1 = Mock(spec=Message)
-        mock_research_message_1.content = [mock_research_text_1]
-        mock_research_message_1.stop_reason = "end_turn"
+        ]
 
-        mock_research_text_2 = Mock(spec=TextBlock)
-        mock_research_text_2.text = json.dumps(
-            {
-                "subtask": "Subtask 2",
-                "findings": [
-                    {"claim": "Claim 2", "source": "source2.com", "details": "Details 2"}
-                ],
-            }
-        )
-        mock_research_message_2 = Mock(spec=Message)
-        mock_research_message_2.content = [mock_research_text_2]
-        mock_research_message_2.stop_reason = "end_turn"
+    def test_unknown_tool_raises(self, mock_web_search):
+        """Test unknown tools are rejected without searching."""
+        with pytest.raises(ValueError, match="Unknown tool: calculator"):
+            _execute_tool("calculator", {"expression": "1+1"}, "test_key")
 
-        # Mock synthesizer response
-        mock_synth_text = Mock(spec=TextBlock)
-        mock_synth_text.text = json.dumps(
-            {
-                "summary": "Research summary",
-                "sections": [
-                    {
-                        "title": "Section 1",
-                        "content": "Section content",
-                        "sources": ["source1.com"],
-                    }
-                ],
-                "key_insights": ["Insight 1", "Insight 2"],
-            }
-        )
-        mock_synth_message = Mock(spec=Message)
-        mock_synth_message.content = [mock_synth_text]
-        mock_synth_message.stop_reason = "end_turn"
+        mock_web_search.assert_not_called()
 
-        # Mock critic response
-        mock_critic_text = Mock(spec=TextBlock)
-        mock_critic_text.text = json.dumps(
-            {
-                "overall_quality": "Good",
-                "issues": [],
-                "suggestions": ["Add more sources"],
-                "needs_more_research": False,
-            }
+
+class TestWorkflow:
+    """Tests for research workflow integration with Pydantic models."""
+
+    def test_run_research_workflow(self, mock_client, mock_web_search, workflow_responses):
+        """Test complete workflow returns WorkflowResult, researching subtasks concurrently."""
+        # Each researcher waits for the other, so sequential calls would break the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        mock_client.messages.create.side_effect = _route_replies(
+            workflow_responses, on_research=lambda subtask: barrier.wait()
         )
-        mock_critic_message = Mock(spec=Message)
-        mock_critic_message.content = [mock_critic_text]
-        mock_critic_message.stop_reason = "end_turn"
-
-        # Set up API call sequence
-        client.messages.create.side_effect = [
-            mock_coord_message,
-            mock_research_message_1,
-            mock_research_message_2,
-            mock_synth_message,
-            mock_critic_message,
-        ]
 
         # Run workflow
         result = run_research_workflow(
             query="Test query",
-            client=client,
+            client=mock_client,
             coordinator_prompt="Coordinator prompt",
             researcher_prompt="Researcher prompt with {current_date}",
             synthesizer_prompt="Synthesizer prompt",
@@ -111,176 +237,112 @@ class TestWorkflow:
             tavily_api_key="test_key",
         )
 
-        # Assert WorkflowResult structure
-        assert isinstance(result, WorkflowResult)
-        assert result.query == "Test query"
-        assert len(result.subtasks) == 2
-        assert len(result.research_results) == 2
-        assert isinstance(result.research_results[0], ResearchResult)
-        assert isinstance(result.synthesis, SynthesizedReport)
-        assert isinstance(result.critique, CriticReview)
-
-        # Verify research results
-        assert result.research_results[0].subtask == "Subtask 1"
-        assert result.research_results[1].subtask == "Subtask 2"
+        mock_web_search.assert_not_called()
 
-        # Verify synthesis
-        assert result.synthesis.summary == "Research summary"
-        assert len(result.synthesis.sections) == 1
-
-        # Verify critique
-        assert result.critique.overall_quality == "Good"
-        assert result.critique.needs_more_research is False
-
-    @patch("orchestration.workflow.execute_web_search")
-    def test_run_research_workflow_with_tool_use(self, mock_web_search):
-        """Test workflow handles tool use in researcher."""
-        client = Mock()
-
-        # Mock web search - returns SearchResult Pydantic models
-        mock_web_search.return_value = [
-            SearchResult(title="Search Result", url="https://test.com", content="Data", score=0.85)
-        ]
-
-        # Mock coordinator
-        mock_coord_text = Mock(spec=TextBlock)
-        mock_coord_text.text = json.dumps({"subtasks": ["Research task", "Analysis task"]})
-        mock_coord_message = Mock(spec=Message)
-        mock_coord_message.content = [mock_coord_text]
-        mock_coord_message.stop_reason = "end_turn"
-
-        # Mock researcher with tool use (for first subtask)
-        from anthropic.types import ToolUseBlock
-
-        mock_tool_block = Mock(spec=ToolUseBlock)
-        mock_tool_block.type = "tool_use"
-        mock_tool_block.name = "web_search"
-        mock_tool_block.input = {"query": "test query"}
-        mock_tool_block.id = "tool_123"
-
-        mock_tool_message = Mock(spec=Message)
-        mock_tool_message.content = [mock_tool_block]
-        mock_tool_message.stop_reason = "tool_use"
-
-        # Researcher final response after tool use
-        mock_research_text = Mock(spec=TextBlock)
-        mock_research_text.text = json.dumps(
-            {
-                "subtask": "Research task",
-                "findings": [
-                    {"claim": "Found via search", "source": "test.com", "details": "Info"}
-                ],
-            }
+        # Nested models are guaranteed by WorkflowResult's own validation
+        assert isinstance(result, WorkflowResult)
+        assert result.model_dump() == EXPECTED_WORKFLOW_RESULT
+
+        # Only researcher calls get the web search tool, as the prebuilt payload
+        assert _RESEARCH_TOOLS == [WEB_SEARCH_TOOL.to_dict()]
+        tools = [call.kwargs.get("tools") for call in mock_client.messages.create.call_args_list]
+        assert tools[0] is None
+        assert all(researcher_tools is _RESEARCH_TOOLS for researcher_tools in tools[1:3])
+        assert tools[3:] == [None, None]
+
+    def test_run_research_workflow_with_tool_use(
+        self, mock_client, mock_web_search, workflow_responses, make_tool_use_response
+    ):
+        """Test a researcher tool_use turn is dispatched to web search."""
+        mock_web_search.return_value = []
+
+        # First researcher asks for a search before answering
+        responses = dict(workflow_responses)
+        responses["Subtask 1"] = (
+            make_tool_use_response("web_search", {"query": "test query"}, "tool_123"),
+            *responses["Subtask 1"],
         )
-        mock_research_message = Mock(spec=Message)
-        mock_research_message.content = [mock_research_text]
-        mock_research_message.stop_reason = "end_turn"
+        mock_client.messages.create.side_effect = _route_replies(responses)
 
-        # Mock second researcher (no tool use)
-        mock_research_text_2 = Mock(spec=TextBlock)
-        mock_research_text_2.text = json.dumps(
-            {
-                "subtask": "Analysis task",
-                "findings": [
-                    {"claim": "Analysis result", "source": "analysis.com", "details": "Data"}
-                ],
-            }
+        run_research_workflow(
+            query="Test query",
+            client=mock_client,
+            coordinator_prompt="Coordinator prompt",
+            researcher_prompt="Researcher prompt with {current_date}",
+            synthesizer_prompt="Synthesizer prompt",
+            critic_prompt="Critic prompt",
+            tavily_api_key="test_key",
         )
-        mock_research_message_2 = Mock(spec=Message)
-        mock_research_message_2.content = [mock_research_text_2]
-        mock_research_message_2.stop_reason = "end_turn"
 
-        # Mock synthesizer
-        mock_synth_text = Mock(spec=TextBlock)
-        mock_synth_text.text = json.dumps(
-            {
-                "summary": "Summary",
-                "sections": [{"title": "S1", "content": "C1", "sources": []}],
-                "key_insights": ["I1"],
-            }
+        mock_web_search.assert_called_once_with("test query", "test_key")
+
+    def test_run_research_workflow_fails_fast(
+        self, mock_client, mock_web_search, workflow_responses, make_tool_use_response
+    ):
+        """Test a failing subtask is raised at once and stops the other researchers."""
+        mock_web_search.return_value = []
+        started = threading.Event()
+        release = threading.Event()
+        finished = threading.Event()
+
+        def hold_subtask_2(subtask):
+            if subtask == "Subtask 2":
+                if not started.is_set():
+                    started.set()
+                    release.wait(timeout=5)
+                    finished.set()
+            else:
+                # Fail subtask 1 only once subtask 2 is in flight
+                started.wait(timeout=5)
+
+        # Subtask 2's in-flight call asks for a search, which would need another turn
+        responses = dict(workflow_responses)
+        responses["Subtask 1"] = (Exception("API Error"),)
+        responses["Subtask 2"] = (
+            make_tool_use_response("web_search", {"query": "test query"}, "tool_123"),
+            *responses["Subtask 2"],
         )
-        mock_synth_message = Mock(spec=Message)
-        mock_synth_message.content = [mock_synth_text]
-        mock_synth_message.stop_reason = "end_turn"
-
-        # Mock critic
-        mock_critic_text = Mock(spec=TextBlock)
-        mock_critic_text.text = json.dumps(
-            {
-                "overall_quality": "Good",
-                "issues": [],
-                "suggestions": [],
-                "needs_more_research": False,
-            }
+        mock_client.messages.create.side_effect = _route_replies(
+            responses, on_research=hold_subtask_2
         )
-        mock_critic_message = Mock(spec=Message)
-        mock_critic_message.content = [mock_critic_text]
-        mock_critic_message.stop_reason = "end_turn"
-
-        client.messages.create.side_effect = [
-            mock_coord_message,
-            mock_tool_message,
-            mock_research_message,  # After tool use
-            mock_research_message_2,
-            mock_synth_message,
-            mock_critic_message,
-        ]
+        threads_before = set(threading.enumerate())
+
+        try:
+            with pytest.raises(RuntimeError, match="Research failed"):
+                run_research_workflow(
+                    query="Test query",
+                    client=mock_client,
+                    coordinator_prompt="Coordinator prompt",
+                    researcher_prompt="Researcher prompt with {current_date}",
+                    synthesizer_prompt="Synthesizer prompt",
+                    critic_prompt="Critic prompt",
+                    tavily_api_key="test_key",
+                )
 
-        result = run_research_workflow(
-            query="Test",
-            client=client,
-            coordinator_prompt="Coord",
-            researcher_prompt="Research {current_date}",
-            synthesizer_prompt="Synth",
-            critic_prompt="Critic",
-            tavily_api_key="key",
-        )
+            assert not finished.is_set()
+        finally:
+            release.set()
 
-        # Verify tool was executed
-        mock_web_search.assert_called_once_with("test query", "key")
+        # Let the researcher still running wind down before counting its calls
+        for worker in set(threading.enumerate()) - threads_before:
+            worker.join(timeout=5)
 
-        # Verify workflow completed
-        assert isinstance(result, WorkflowResult)
-        assert len(result.research_results) == 2
-        assert result.research_results[0].findings[0].claim == "Found via search"
+        subtask_2_calls = [
+            call
+            for call in mock_client.messages.create.call_args_list
+            if call.kwargs["messages"][0]["content"] == "Subtask 2"
+        ]
+        assert len(subtask_2_calls) == 1
+        mock_web_search.assert_called_once_with("test query", "test_key")
 
-    def test_workflow_result_structure(self):
+    def test_workflow_result_structure(self, sample_workflow_result):
         """Test WorkflowResult Pydantic model validation."""
-        from agents.models import Finding, SynthesisSection, CriticIssue
-
-        # Create a valid WorkflowResult
-        result = WorkflowResult(
-            query="Test query",
-            subtasks=["Task 1", "Task 2"],
-            research_results=[
-                ResearchResult(
-                    subtask="Task 1",
-                    findings=[
-                        Finding(claim="Claim", source="source.com", details="Details")
-                    ],
-                )
-            ],
-            synthesis=SynthesizedReport(
-                summary="Summary",
-                sections=[
-                    SynthesisSection(title="Section", content="Content", sources=[])
-                ],
-                key_insights=["Insight"],
-            ),
-            critique=CriticReview(
-                overall_quality="Good",
-                issues=[],
-                suggestions=[],
-                needs_more_research=False,
-            ),
-        )
+        result = sample_workflow_result
 
         # Verify Pydantic model works
         assert result.query == "Test query"
         assert len(result.subtasks) == 2
-        assert isinstance(result.research_results[0], ResearchResult)
-        assert isinstance(result.synthesis, SynthesizedReport)
-        assert isinstance(result.critique, CriticReview)
+        assert result.research_results[0].subtask == "Task 1"
 
         # Verify we can convert to dict
         result_dict = result.model_dump()
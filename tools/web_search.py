@@ -1,12 +1,23 @@
 """Web search tool using Tavily API."""
 
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
 from typing import Any
 from tavily import TavilyClient
 from agents.models import SearchResult, ToolSchema
 
 logger = logging.getLogger(__name__)
 
+# Search results cache, keyed on (normalized query, API key), least recently used first
+_CACHE_SIZE = 256
+_results_cache: OrderedDict[tuple[str, str], tuple[SearchResult, ...]] = OrderedDict()
+# Searches currently running, so concurrent callers wait instead of repeating them
+_in_flight: dict[tuple[str, str], Future[tuple[SearchResult, ...]]] = {}
+_cache_lock = threading.Lock()
+
 # Tool schema for Anthropic API
 WEB_SEARCH_TOOL = ToolSchema(
     name="web_search",
@@ -24,23 +35,60 @@ WEB_SEARCH_TOOL = ToolSchema(
 )
 
 
-def execute_web_search(query: str, api_key: str) -> list[SearchResult]:
+@lru_cache(maxsize=8)
+def _get_client(api_key: str) -> TavilyClient:
     """
-    Execute a web search using Tavily API.
+    Return a shared Tavily client for the given API key.
+
+    Reusing the client keeps its HTTP session, so concurrent researchers share
+    pooled keep-alive connections instead of paying a new TLS handshake per search.
 
     Args:
-        query: The search query
         api_key: Tavily API key
 
     Returns:
-        List of SearchResult objects with title, url, content, and score
+        TavilyClient bound to the API key
+    """
+    client = TavilyClient(api_key=api_key)
+
+    return client
+
+
+def _normalize_query(query: str) -> str:
+    """
+    Build the cache key for a search query.
+
+    Collapses whitespace and casefolds so trivially different queries share a
+    cache entry. The result is never sent to Tavily.
+
+    Args:
+        query: The search query as given by the caller
+
+    Returns:
+        Normalized query used as the cache key
+    """
+    normalized = " ".join(query.split()).casefold()
+
+    return normalized
+
+
+def _search(query: str, api_key: str) -> tuple[SearchResult, ...]:
+    """
+    Run a Tavily search without caching.
+
+    Args:
+        query: The search query, sent to Tavily as given
+        api_key: Tavily API key
+
+    Returns:
+        Tuple of SearchResult objects
 
     Raises:
         Exception: If the search API call fails
     """
-    client = TavilyClient(api_key=api_key)
+    client = _get_client(api_key)
 
-    logger.debug(f"Executing Tavily search: {query}")
+    logger.debug("Executing Tavily search: %s", query)
     try:
         response = client.search(
             query=query,
@@ -48,19 +96,87 @@ def execute_web_search(query: str, api_key: str) -> list[SearchResult]:
             max_results=5
         )
     except Exception as e:
-        logger.error(f"Tavily search failed: {e}")
+        logger.error("Tavily search failed: %s", e)
         raise
 
-    results = []
-    for result in response.get("results", []):
-        search_result = SearchResult(
+    results = [
+        SearchResult(
             title=result.get("title", ""),
             url=result.get("url", ""),
             content=result.get("content", ""),
             score=result.get("score", 0.0)
         )
-        results.append(search_result)
+        for result in response.get("results", [])
+    ]
+
+    logger.debug("Tavily returned %d results", len(results))
+    search_results = tuple(results)
+
+    return search_results
+
+
+def _clear_cache() -> None:
+    """
+    Forget all cached search results.
+
+    Searches still in flight are unaffected and will cache their results when
+    they complete.
+    """
+    with _cache_lock:
+        _results_cache.clear()
+
+
+def execute_web_search(query: str, api_key: str) -> list[SearchResult]:
+    """
+    Execute a web search using Tavily API.
+
+    Results are cached in memory, keyed on the query with case and extra
+    whitespace ignored, while Tavily always receives the query as given.
+    Repeated searches are served from the cache, and a search for a query that
+    is already running waits for that call instead of repeating it. Failed
+    searches are never cached; callers waiting on one get the same error.
+
+    Args:
+        query: The search query
+        api_key: Tavily API key
+
+    Returns:
+        List of SearchResult objects with title, url, content, and score
+
+    Raises:
+        Exception: If the search API call fails
+    """
+    key = (_normalize_query(query), api_key)
+
+    with _cache_lock:
+        results = _results_cache.get(key)
+        pending = _in_flight.get(key)
+        if results is not None:
+            _results_cache.move_to_end(key)
+        elif pending is None:
+            future: Future[tuple[SearchResult, ...]] = Future()
+            _in_flight[key] = future
+
+    if results is None and pending is not None:
+        logger.debug("Waiting on in-flight Tavily search: %s", query)
+        results = pending.result()
+    elif results is None:
+        try:
+            results = _search(query, api_key)
+        except BaseException as e:
+            # Resolve waiters for any exit, even KeyboardInterrupt, so none block forever
+            future.set_exception(e)
+            raise
+        else:
+            with _cache_lock:
+                _results_cache[key] = results
+                if len(_results_cache) > _CACHE_SIZE:
+                    _results_cache.popitem(last=False)
+            future.set_result(results)
+        finally:
+            with _cache_lock:
+                del _in_flight[key]
 
-    logger.debug(f"Tavily returned {len(results)} results")
+    search_results = list(results)
 
-    return results
+    return search_results